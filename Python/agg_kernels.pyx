@@ -0,0 +1,104 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython versions of the aggregation kernels in tests.py (BENCH_BACKEND=cython)
+Compiled ahead of the timed runs by pyximport, so there is no JIT warm-up
+"""
+
+import numpy as np
+from cython.parallel import prange
+from libc.math cimport INFINITY
+from libc.stdint cimport int8_t, int32_t, int64_t, uint8_t
+
+cdef enum:
+    N_DEPTS = 5           # len(DEPARTMENTS)
+    AGE_GROUPS = 10       # age decades 0..90
+    KERNEL_CHUNK = 65536  # rows per thread-local accumulator
+
+cdef inline Py_ssize_t chunk_count(Py_ssize_t n) nogil:
+    # max/min reductions need at least one partial
+    return max((n + KERNEL_CHUNK - 1) // KERNEL_CHUNK, 1)
+
+def agg_by_dept(const int8_t[::1] dept_codes, const int8_t[::1] ages, const double[::1] salaries):
+    """Count, salary sum, max salary and min age per department for people over 25 earning more than 50,000"""
+    cdef Py_ssize_t n = dept_codes.shape[0]
+    cdef Py_ssize_t n_chunks = chunk_count(n)
+    counts_arr = np.zeros((n_chunks, N_DEPTS), np.int64)
+    sums_arr = np.zeros((n_chunks, N_DEPTS), np.float64)
+    max_arr = np.full((n_chunks, N_DEPTS), -INFINITY)
+    min_arr = np.full((n_chunks, N_DEPTS), 127, np.int64)
+    cdef int64_t[:, ::1] counts = counts_arr
+    cdef double[:, ::1] sums = sums_arr
+    cdef double[:, ::1] max_salaries = max_arr
+    cdef int64_t[:, ::1] min_ages = min_arr
+    cdef Py_ssize_t c, i, d
+
+    for c in prange(n_chunks, nogil=True):
+        for i in range(c * KERNEL_CHUNK, min(n, (c + 1) * KERNEL_CHUNK)):
+            if ages[i] > 25 and salaries[i] > 50000:
+                d = dept_codes[i]
+                counts[c, d] += 1
+                sums[c, d] += salaries[i]
+                if salaries[i] > max_salaries[c, d]:
+                    max_salaries[c, d] = salaries[i]
+                if ages[i] < min_ages[c, d]:
+                    min_ages[c, d] = ages[i]
+
+    return counts_arr.sum(axis=0), sums_arr.sum(axis=0), max_arr.max(axis=0), min_arr.min(axis=0)
+
+def agg_age_dept(const int8_t[::1] dept_codes, const int8_t[::1] ages, const double[::1] salaries,
+                 const int32_t[::1] hire_day_offsets, int64_t today):
+    """Count, salary sum and tenure sum per (department, age decade) in one pass"""
+    cdef Py_ssize_t n = dept_codes.shape[0]
+    cdef Py_ssize_t n_chunks = chunk_count(n)
+    counts_arr = np.zeros((n_chunks, N_DEPTS, AGE_GROUPS), np.int64)
+    sums_arr = np.zeros((n_chunks, N_DEPTS, AGE_GROUPS), np.float64)
+    tenure_arr = np.zeros((n_chunks, N_DEPTS, AGE_GROUPS), np.int64)
+    cdef int64_t[:, :, ::1] counts = counts_arr
+    cdef double[:, :, ::1] sums = sums_arr
+    cdef int64_t[:, :, ::1] tenure = tenure_arr
+    cdef Py_ssize_t c, i, d, g
+
+    for c in prange(n_chunks, nogil=True):
+        for i in range(c * KERNEL_CHUNK, min(n, (c + 1) * KERNEL_CHUNK)):
+            d = dept_codes[i]
+            g = ages[i] // 10
+            counts[c, d, g] += 1
+            sums[c, d, g] += salaries[i]
+            tenure[c, d, g] += today - hire_day_offsets[i]
+
+    return counts_arr.sum(axis=0), sums_arr.sum(axis=0), tenure_arr.sum(axis=0)
+
+def agg_dept_analysis(const int8_t[::1] dept_codes, const int8_t[::1] ages, const double[::1] salaries):
+    """Employee count, high earner count and age sum per department"""
+    cdef Py_ssize_t n = dept_codes.shape[0]
+    cdef Py_ssize_t n_chunks = chunk_count(n)
+    counts_arr = np.zeros((n_chunks, N_DEPTS), np.int64)
+    high_arr = np.zeros((n_chunks, N_DEPTS), np.int64)
+    age_arr = np.zeros((n_chunks, N_DEPTS), np.int64)
+    cdef int64_t[:, ::1] counts = counts_arr
+    cdef int64_t[:, ::1] high_earners = high_arr
+    cdef int64_t[:, ::1] age_sums = age_arr
+    cdef Py_ssize_t c, i, d
+
+    for c in prange(n_chunks, nogil=True):
+        for i in range(c * KERNEL_CHUNK, min(n, (c + 1) * KERNEL_CHUNK)):
+            d = dept_codes[i]
+            counts[c, d] += 1
+            if salaries[i] > 75000:
+                high_earners[c, d] += 1
+            age_sums[c, d] += ages[i]
+
+    return counts_arr.sum(axis=0), high_arr.sum(axis=0), age_arr.sum(axis=0)
+
+def young_professional_mask(const int8_t[::1] ages, const double[::1] salaries,
+                            const int32_t[::1] hire_day_offsets, int64_t today):
+    """Recent hires (last 5 years) under 30 earning more than 60,000"""
+    cdef Py_ssize_t n = ages.shape[0]
+    mask_arr = np.zeros(n, np.uint8)
+    cdef uint8_t[::1] mask = mask_arr
+    cdef Py_ssize_t i
+
+    for i in prange(n, nogil=True):
+        mask[i] = today - hire_day_offsets[i] < 5 * 365 and ages[i] < 30 and salaries[i] > 60000
+
+    return mask_arr.view(np.bool_)
@@ -2,41 +2,83 @@
 """
 Python 3.13.3 Performance Demo
 Equivalent to the C# LINQ and Java Stream performance tests
-Optimized for maximum performance using modern Python features
+Optimized for maximum performance using modern Python features and NumPy columnar data
 """
 
+import os
 import sys
 import time
-import random
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import List, Dict, Tuple, Iterator
-from collections import defaultdict, Counter
+from collections import Counter
 from functools import reduce
 from itertools import groupby, takewhile, islice
-import statistics
-import locale
 import gc
 import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
 
-# Set locale for currency formatting
 try:
-    locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
-except locale.Error:
-    try:
-        locale.setlocale(locale.LC_ALL, 'English_United States.1252')
-    except locale.Error:
-        pass  # Use default locale
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    # Fall back to running the kernels as plain Python
+    HAVE_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
-@dataclass(slots=True, frozen=True)  # Python 3.10+ slots for memory efficiency
-class Person:
-    """Immutable Person dataclass with slots for memory efficiency"""
-    id: int
-    name: str
-    age: int
-    department: str
-    salary: float
-    hire_date: datetime
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+DEPARTMENTS = ('Engineering', 'Sales', 'Marketing', 'HR', 'Finance')
+NAME_PREFIXES = ('John', 'Jane', 'Bob', 'Alice', 'Charlie', 'Diana', 'Eve', 'Frank')
+SALARY_BRACKETS = ('Entry Level', 'Junior', 'Mid Level', 'Senior', 'Executive')
+SALARY_BRACKET_BOUNDS = np.array([40000, 60000, 80000, 100000])  # where each bracket starts
+
+# A name is its prefix followed by the id digits, so its letters only depend on
+# the prefix code; these per-prefix tables are indexed by People.name_codes
+NAME_HAS_AE = np.array([('a' in name) or ('e' in name) for name in NAME_PREFIXES])
+NAME_PREFIX_LENGTHS = np.array([len(name) for name in NAME_PREFIXES])
+
+@dataclass(slots=True)
+class People:
+    """Column-oriented (struct of arrays) person table, one NumPy array per field"""
+    ids: np.ndarray               # int64
+    name_codes: np.ndarray        # int8, index into NAME_PREFIXES; name is prefix + id
+    ages: np.ndarray              # int8
+    dept_codes: np.ndarray        # int8, index into DEPARTMENTS
+    salaries: np.ndarray          # float64
+    hire_day_offsets: np.ndarray  # int32, hire date as days since the Unix epoch
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index) -> 'People':
+        return People(
+            ids=self.ids[index],
+            name_codes=self.name_codes[index],
+            ages=self.ages[index],
+            dept_codes=self.dept_codes[index],
+            salaries=self.salaries[index],
+            hire_day_offsets=self.hire_day_offsets[index]
+        )
+
+    def names_of(self, rows) -> np.ndarray:
+        """Reconstruct the names of the selected rows only"""
+        return np.char.add(np.array(NAME_PREFIXES)[self.name_codes[rows]], self.ids[rows].astype(str))
 
 @dataclass(slots=True, frozen=True)
 class DepartmentStats:
@@ -54,7 +96,9 @@ class AgeGroupStats:
     total_salary: float
     average_tenure: float
 
-@dataclass(slots=True, frozen=True)
+# Not frozen: string operations build one per matching person (~750K rows), and a
+# frozen __init__ pays an object.__setattr__ call per field
+@dataclass(slots=True)
 class PersonProjection:
     id: int
     upper_name: str
@@ -86,190 +130,626 @@ class PerformanceTimer:
         self.end_time = None
     
     def start(self):
-        gc.collect()  # Force garbage collection for consistent timing
-        self.start_time = time.perf_counter()
+        gc.disable()  # Keep collector pauses out of the timed region
+        self.start_time = time.perf_counter_ns()
     
     def stop(self):
-        self.end_time = time.perf_counter()
-        return (self.end_time - self.start_time) * 1000  # Convert to milliseconds
+        self.end_time = time.perf_counter_ns()
+        gc.enable()
+        return (self.end_time - self.start_time) / 1_000_000  # Convert to milliseconds
+
+def today_day_number() -> int:
+    """Today's date as days since the Unix epoch"""
+    return int(np.datetime64('today', 'D').astype(np.int64))
+
+@njit('void(int64[:], int8[:], int8[:])', parallel=True, cache=True)
+def fill_code_columns(ids, name_codes, dept_codes):
+    """Fill ids and the name/department codes, which cycle with the row number"""
+    for i in prange(len(ids)):
+        ids[i] = i + 1
+        name_codes[i] = (i + 1) % len(NAME_PREFIXES)  # prefix ids[i] % 8
+        dept_codes[i] = i % len(DEPARTMENTS)          # department (ids[i] - 1) % 5
 
-def generate_test_data(count: int) -> List[Person]:
-    """Generate test data efficiently using list comprehension and random seed"""
-    random.seed(42)  # Fixed seed for consistent results
+def generate_test_data(count: int) -> People:
+    """Generate test data as NumPy columns in one shot, without a per-row Python loop"""
+    rng = np.random.default_rng(42)  # Fixed seed for consistent results
+    
+    today = today_day_number()
+    
+    if HAVE_NUMBA:
+        ids = np.empty(count, dtype=np.int64)
+        name_codes = np.empty(count, dtype=np.int8)
+        dept_codes = np.empty(count, dtype=np.int8)
+        fill_code_columns(ids, name_codes, dept_codes)
+    else:
+        # fill_code_columns would be a per-row Python loop; tile the code cycles instead
+        name_cycle = np.arange(len(NAME_PREFIXES), dtype=np.int8)
+        dept_cycle = np.arange(len(DEPARTMENTS), dtype=np.int8)
+        ids = np.arange(1, count + 1, dtype=np.int64)
+        name_codes = np.tile(name_cycle, count // len(name_cycle) + 2)[1:count + 1]
+        dept_codes = np.tile(dept_cycle, count // len(dept_cycle) + 1)[:count]
+    
+    return People(
+        ids=ids,
+        name_codes=name_codes,
+        ages=rng.integers(22, 65, count, dtype=np.int8),
+        dept_codes=dept_codes,
+        salaries=rng.uniform(30000, 150000, count),
+        hire_day_offsets=today - rng.integers(1, 3651, count, dtype=np.int32)
+    )
+
+def department_stats(dept_codes, counts, salary_sums, max_salaries, min_ages) -> List[DepartmentStats]:
+    """Keep departments with count > 10, sorted by average salary descending"""
+    means = salary_sums / np.maximum(counts, 1)
+    survivors = np.flatnonzero(counts > 10)
+    survivors = survivors[np.argsort(-means[survivors], kind='stable')]
     
-    departments = ['Engineering', 'Sales', 'Marketing', 'HR', 'Finance']
-    names = ['John', 'Jane', 'Bob', 'Alice', 'Charlie', 'Diana', 'Eve', 'Frank']
+    return [
+        DepartmentStats(
+            department=DEPARTMENTS[dept_codes[group]],
+            count=int(counts[group]),
+            average_salary=float(means[group]),
+            max_salary=float(max_salaries[group]),
+            min_age=int(min_ages[group])
+        )
+        for group in survivors
+    ]
+
+def run_complex_operations(people: People) -> List[DepartmentStats]:
+    """Complex operation chain equivalent to LINQ complex operations"""
     
-    # Pre-generate random values for better performance
-    ages = [random.randint(22, 64) for _ in range(count)]
-    salaries = [random.uniform(30000, 150000) for _ in range(count)]
-    hire_days = [random.randint(1, 3650) for _ in range(count)]
+    # Filter with a boolean mask over the columns, kept as row indices
+    rows = np.flatnonzero((people.ages > 25) & (people.salaries > 50000))
+    dept_codes = people.dept_codes[rows]
+    
+    # Group offsets come from the per-department counts; a stable sort on the
+    # int8 codes is a counting sort that lays each group out contiguously.
+    # Salaries and ages are gathered straight into sorted order, with no
+    # intermediate filtered copy
+    counts = np.bincount(dept_codes, minlength=len(DEPARTMENTS))
+    offsets = np.cumsum(counts) - counts
+    rows = rows[np.argsort(dept_codes, kind='stable')]
+    salaries_sorted = people.salaries[rows]
+    present = np.flatnonzero(counts)
+    starts = offsets[present]
+    
+    # Every aggregate is one reduceat pass over the group boundaries
+    return department_stats(
+        present,
+        counts[present],
+        np.add.reduceat(salaries_sorted, starts),
+        np.maximum.reduceat(salaries_sorted, starts),
+        np.minimum.reduceat(people.ages[rows], starts)
+    )
+
+AGE_GROUPS = 10         # age decades 0..90
+KERNEL_CHUNK = 1 << 16  # rows per thread-local accumulator in the Numba kernels
+
+@njit(parallel=True, cache=True)
+def agg_age_dept(dept_codes, ages, salaries, hire_day_offsets, today):
+    """Count, salary sum and tenure sum per (department, age decade) in one pass"""
+    n = len(dept_codes)
+    n_chunks = (n + KERNEL_CHUNK - 1) // KERNEL_CHUNK
+    counts = np.zeros((n_chunks, len(DEPARTMENTS), AGE_GROUPS), np.int64)
+    sums = np.zeros((n_chunks, len(DEPARTMENTS), AGE_GROUPS), np.float64)
+    tenure = np.zeros((n_chunks, len(DEPARTMENTS), AGE_GROUPS), np.int64)
+    
+    for c in prange(n_chunks):
+        for i in range(c * KERNEL_CHUNK, min(n, (c + 1) * KERNEL_CHUNK)):
+            d = dept_codes[i]
+            g = ages[i] // 10
+            counts[c, d, g] += 1
+            sums[c, d, g] += salaries[i]
+            tenure[c, d, g] += today - hire_day_offsets[i]
+    
+    return counts.sum(axis=0), sums.sum(axis=0), tenure.sum(axis=0)
+
+def agg_age_dept_bincount(dept_codes, ages, salaries, hire_day_offsets, today):
+    """agg_age_dept without Numba: bincount over a combined (department, decade) key"""
+    keys = dept_codes.astype(np.intp) * AGE_GROUPS + ages // 10
+    shape = (len(DEPARTMENTS), AGE_GROUPS)
+    size = shape[0] * shape[1]
+    
+    counts = np.bincount(keys, minlength=size).reshape(shape)
+    sums = np.bincount(keys, weights=salaries, minlength=size).reshape(shape)
+    tenure = np.bincount(keys, weights=today - hire_day_offsets, minlength=size).reshape(shape)
+    return counts, sums, tenure
+
+def age_group_stats(counts, total_salaries, total_tenure) -> List[AgeGroupStats]:
+    """Keep (department, age decade) groups with more than 5 people, sorted by both keys"""
+    results = [
+        AgeGroupStats(
+            department=DEPARTMENTS[dept_code],
+            age_group=int(age_group) * 10,
+            count=int(counts[dept_code, age_group]),
+            total_salary=float(total_salaries[dept_code, age_group]),
+            average_tenure=float(total_tenure[dept_code, age_group] / counts[dept_code, age_group])
+        )
+        for dept_code, age_group in zip(*np.nonzero(counts > 5))
+    ]
+    
+    return sorted(results, key=lambda x: (x.department, x.age_group))
+
+def run_groupby_operations(people: People) -> List[AgeGroupStats]:
+    """GroupBy operations with aggregation"""
     
+    aggregate = agg_age_dept if HAVE_NUMBA else agg_age_dept_bincount
+    return age_group_stats(*aggregate(
+        people.dept_codes, people.ages, people.salaries, people.hire_day_offsets, today_day_number()
+    ))
+
+def run_string_operations(people: People) -> List[PersonProjection]:
+    """String operations with filtering and projection"""
+    
+    # Name length is prefix length plus id digit count
+    id_digits = np.searchsorted(10 ** np.arange(1, 19), people.ids, side='right') + 1
+    name_lengths = NAME_PREFIX_LENGTHS[people.name_codes] + id_digits
+    
+    # Filter people with 'a' or 'e' in name and name length > 5
+    rows = np.flatnonzero(NAME_HAS_AE[people.name_codes] & (name_lengths > 5))
+    
+    # Build names for the surviving rows only; upper-casing runs over the 8
+    # prefixes instead of every name since the digits are unaffected
+    prefixes = np.array(NAME_PREFIXES)
+    codes = people.name_codes[rows]
+    suffixes = people.ids[rows].astype(str)
+    names = np.char.add(prefixes[codes], suffixes)
+    upper_names = np.char.add(np.char.upper(prefixes)[codes], suffixes)
+    
+    # Sort by upper name
+    order = np.argsort(upper_names, kind='stable')
+    rows = rows[order]
+    
+    salaries = people.salaries[rows]
+    is_manager = np.char.endswith(names[order], 'Manager') | (salaries > 100000)
+    
+    # Project to new structure
     return [
-        Person(
-            id=i,
-            name=f"{names[i % len(names)]}{i}",
-            age=ages[i-1],
-            department=departments[(i-1) % len(departments)],
-            salary=salaries[i-1],
-            hire_date=datetime.now() - timedelta(days=hire_days[i-1])
+        PersonProjection(
+            id=person_id,
+            upper_name=upper_name,
+            name_length=name_length,
+            formatted_salary=f"${salary:,.2f}",
+            is_manager=manager
+        )
+        for person_id, upper_name, name_length, salary, manager in zip(
+            people.ids[rows].tolist(), upper_names[order].tolist(), name_lengths[rows].tolist(),
+            salaries.tolist(), is_manager.tolist()
         )
-        for i in range(1, count + 1)
     ]
 
-def run_complex_operations(people: List[Person]) -> List[DepartmentStats]:
-    """Complex operation chain equivalent to LINQ complex operations"""
+def department_analysis(counts, high_earners, age_sums) -> List[DepartmentAnalysis]:
+    """Keep departments with more than 50 employees, sorted by high earners descending"""
+    survivors = np.flatnonzero(counts > 50)
+    survivors = survivors[np.argsort(-high_earners[survivors], kind='stable')]
+    
+    return [
+        DepartmentAnalysis(
+            department=DEPARTMENTS[dept_code],
+            employee_count=int(counts[dept_code]),
+            high_earners=int(high_earners[dept_code]),
+            average_age=float(age_sums[dept_code] / counts[dept_code])
+        )
+        for dept_code in survivors
+    ]
+
+def run_nested_queries(people: People) -> List[DepartmentAnalysis]:
+    """Nested queries equivalent"""
     
-    # Filter and group efficiently
-    filtered = [p for p in people if p.age > 25 and p.salary > 50000]
+    # Analyze every department in a single bincount pass per column
+    dept_codes = people.dept_codes
+    return department_analysis(
+        np.bincount(dept_codes, minlength=len(DEPARTMENTS)),
+        np.bincount(dept_codes, weights=people.salaries > 75000, minlength=len(DEPARTMENTS)),
+        np.bincount(dept_codes, weights=people.ages, minlength=len(DEPARTMENTS))
+    )
+
+def top_young_professionals(people: People, candidates, today: int, top_n: int = 1000) -> List[YoungProfessional]:
+    """Project the top_n candidates by years of service, descending"""
+    tenure_days = today - people.hire_day_offsets[candidates]
     
-    # Group by department using defaultdict for better performance
-    groups = defaultdict(list)
-    for person in filtered:
-        groups[person.department].append(person)
+    # Partial selection: keep only rows at least as long-serving as the top_n-th
+    # one instead of sorting every candidate
+    if len(candidates) > top_n:
+        cutoff = np.partition(tenure_days, len(candidates) - top_n)[len(candidates) - top_n]
+        keep = tenure_days >= cutoff
+        candidates, tenure_days = candidates[keep], tenure_days[keep]
     
-    # Calculate stats and filter
-    stats = []
-    for dept, dept_people in groups.items():
-        if len(dept_people) > 10:
-            salaries = [p.salary for p in dept_people]
-            ages = [p.age for p in dept_people]
-            
-            stats.append(DepartmentStats(
-                department=dept,
-                count=len(dept_people),
-                average_salary=statistics.mean(salaries),
-                max_salary=max(salaries),
-                min_age=min(ages)
-            ))
-    
-    # Sort by average salary descending
-    return sorted(stats, key=lambda x: x.average_salary, reverse=True)
-
-def run_groupby_operations(people: List[Person]) -> List[AgeGroupStats]:
-    """GroupBy operations with aggregation"""
+    # Sort by years of service descending and take top_n
+    order = np.argsort(-tenure_days, kind='stable')[:top_n]
+    top, tenure_days = candidates[order], tenure_days[order]
     
-    # Create groups efficiently
-    groups = defaultdict(list)
-    now = datetime.now()
+    bracket_codes = np.searchsorted(SALARY_BRACKET_BOUNDS, people.salaries[top], side='right')
     
-    for person in people:
-        key = (person.department, (person.age // 10) * 10)
-        groups[key].append(person)
+    # Project only the selected rows
+    return [
+        YoungProfessional(
+            id=person_id,
+            name=name,
+            age=age,
+            salary_bracket=SALARY_BRACKETS[bracket],
+            years_of_service=tenure / 365.25,
+            is_young_professional=True
+        )
+        for person_id, name, age, bracket, tenure in zip(
+            people.ids[top].tolist(), people.names_of(top).tolist(), people.ages[top].tolist(),
+            bracket_codes.tolist(), tenure_days.tolist()
+        )
+    ]
+
+def run_projection_operations(people: People) -> List[YoungProfessional]:
+    """Projection with filtering operations"""
     
-    # Calculate group statistics
-    results = []
-    for (dept, age_group), group_people in groups.items():
-        if len(group_people) > 5:
-            total_salary = sum(p.salary for p in group_people)
-            tenure_days = [(now - p.hire_date).days for p in group_people]
+    today = today_day_number()
+    tenure_days = today - people.hire_day_offsets
+    
+    # Filter recent hires (last 5 years) who are young professionals
+    mask = (tenure_days < 5 * 365) & (people.ages < 30) & (people.salaries > 60000)
+    return top_young_professionals(people, np.flatnonzero(mask), today)
+
+@njit(parallel=True, cache=True)
+def scan_all(dept_codes, ages, salaries, hire_day_offsets, today):
+    """Department, age group and nested aggregates plus the young professional mask in one pass"""
+    n = len(dept_codes)
+    n_chunks = max((n + KERNEL_CHUNK - 1) // KERNEL_CHUNK, 1)  # max/min need at least one partial
+    n_depts = len(DEPARTMENTS)
+    
+    # Complex operations: people over 25 earning more than 50,000
+    filtered_counts = np.zeros((n_chunks, n_depts), np.int64)
+    filtered_sums = np.zeros((n_chunks, n_depts), np.float64)
+    max_salaries = np.full((n_chunks, n_depts), -np.inf)
+    min_ages = np.full((n_chunks, n_depts), 127, np.int64)
+    
+    # GroupBy operations and nested queries
+    group_counts = np.zeros((n_chunks, n_depts, AGE_GROUPS), np.int64)
+    group_sums = np.zeros((n_chunks, n_depts, AGE_GROUPS), np.float64)
+    group_tenure = np.zeros((n_chunks, n_depts, AGE_GROUPS), np.int64)
+    high_earners = np.zeros((n_chunks, n_depts), np.int64)
+    age_sums = np.zeros((n_chunks, n_depts), np.int64)
+    
+    # Projection
+    young_pros = np.zeros(n, np.bool_)
+    
+    for c in prange(n_chunks):
+        for i in range(c * KERNEL_CHUNK, min(n, (c + 1) * KERNEL_CHUNK)):
+            d = dept_codes[i]
+            age = ages[i]
+            salary = salaries[i]
+            tenure = today - hire_day_offsets[i]
+            
+            if age > 25 and salary > 50000:
+                filtered_counts[c, d] += 1
+                filtered_sums[c, d] += salary
+                max_salaries[c, d] = max(max_salaries[c, d], salary)
+                min_ages[c, d] = min(min_ages[c, d], age)
+            
+            g = age // 10
+            group_counts[c, d, g] += 1
+            group_sums[c, d, g] += salary
+            group_tenure[c, d, g] += tenure
+            if salary > 75000:
+                high_earners[c, d] += 1
+            age_sums[c, d] += age
             
-            results.append(AgeGroupStats(
-                department=dept,
-                age_group=age_group,
-                count=len(group_people),
-                total_salary=total_salary,
-                average_tenure=statistics.mean(tenure_days)
-            ))
-    
-    # Sort by department, then age group
+            young_pros[i] = tenure < 5 * 365 and age < 30 and salary > 60000
+    
+    # Per-chunk partials are reduced by the caller
+    return (
+        filtered_counts, filtered_sums, max_salaries, min_ages,
+        group_counts, group_sums, group_tenure, high_earners, age_sums,
+        young_pros
+    )
+
+def run_fused_operations(people: People):
+    """Complex, groupby, nested and projection results from a single scan of the columns"""
+    
+    today = today_day_number()
+    (filtered_counts, filtered_sums, max_salaries, min_ages,
+     group_counts, group_sums, group_tenure,
+     high_earners, age_sums, young_pros) = scan_all(
+        people.dept_codes, people.ages, people.salaries, people.hire_day_offsets, today
+    )
+    
+    group_counts = group_counts.sum(axis=0)
+    return (
+        department_stats(
+            np.arange(len(DEPARTMENTS)), filtered_counts.sum(axis=0), filtered_sums.sum(axis=0),
+            max_salaries.max(axis=0), min_ages.min(axis=0)
+        ),
+        age_group_stats(group_counts, group_sums.sum(axis=0), group_tenure.sum(axis=0)),
+        department_analysis(group_counts.sum(axis=1), high_earners.sum(axis=0), age_sums.sum(axis=0)),
+        top_young_professionals(people, np.flatnonzero(young_pros), today)
+    )
+
+def people_frame(people: People) -> 'pl.DataFrame':
+    """Wrap the People columns in a Polars DataFrame for the polars backend"""
+    if pl is None:
+        raise ImportError("The polars backend needs the polars package")
+    
+    return pl.DataFrame({
+        'id': people.ids,
+        'name_code': people.name_codes,
+        'age': people.ages,
+        'dept': people.dept_codes,
+        'salary': people.salaries,
+        'hire_day': people.hire_day_offsets
+    })
+
+def polars_names() -> 'pl.Expr':
+    """Name expression: prefix looked up from the name code, followed by the id"""
+    prefixes = pl.col('name_code').replace_strict(
+        list(range(len(NAME_PREFIXES))), list(NAME_PREFIXES), return_dtype=pl.String
+    )
+    return pl.concat_str(prefixes, pl.col('id').cast(pl.String)).alias('name')
+
+def run_complex_operations_polars(frame: 'pl.DataFrame') -> List[DepartmentStats]:
+    """Complex operation chain as a Polars lazy query"""
+    
+    stats = (
+        frame.lazy()
+        .filter((pl.col('age') > 25) & (pl.col('salary') > 50000))
+        .group_by('dept')
+        .agg(
+            pl.len().alias('count'),
+            pl.col('salary').mean().alias('average_salary'),
+            pl.col('salary').max().alias('max_salary'),
+            pl.col('age').min().alias('min_age')
+        )
+        .filter(pl.col('count') > 10)
+        .sort('average_salary', descending=True)
+        .collect()
+    )
+    
+    return [
+        DepartmentStats(
+            department=DEPARTMENTS[dept_code],
+            count=count,
+            average_salary=average_salary,
+            max_salary=max_salary,
+            min_age=min_age
+        )
+        for dept_code, count, average_salary, max_salary, min_age in stats.iter_rows()
+    ]
+
+def run_groupby_operations_polars(frame: 'pl.DataFrame') -> List[AgeGroupStats]:
+    """GroupBy operations as a Polars lazy query"""
+    
+    groups = (
+        frame.lazy()
+        .group_by('dept', (pl.col('age') // 10 * 10).alias('age_group'))
+        .agg(
+            pl.len().alias('count'),
+            pl.col('salary').sum().alias('total_salary'),
+            (today_day_number() - pl.col('hire_day')).mean().alias('average_tenure')
+        )
+        .filter(pl.col('count') > 5)
+        .collect()
+    )
+    
+    results = [
+        AgeGroupStats(
+            department=DEPARTMENTS[dept_code],
+            age_group=age_group,
+            count=count,
+            total_salary=total_salary,
+            average_tenure=average_tenure
+        )
+        for dept_code, age_group, count, total_salary, average_tenure in groups.iter_rows()
+    ]
+    
+    # Sort by department name, then age group
     return sorted(results, key=lambda x: (x.department, x.age_group))
 
-def run_string_operations(people: List[Person]) -> List[PersonProjection]:
-    """String operations with filtering and projection"""
+def run_string_operations_polars(frame: 'pl.DataFrame') -> List[PersonProjection]:
+    """String operations as a Polars lazy query"""
+    
+    name = pl.col('name')
+    projections = (
+        frame.lazy()
+        .select('id', 'salary', polars_names())
+        .filter(name.str.contains('a', literal=True) | name.str.contains('e', literal=True))
+        .filter(name.str.len_chars() > 5)
+        .select(
+            'id',
+            name.str.to_uppercase().alias('upper_name'),
+            name.str.len_chars().alias('name_length'),
+            'salary',
+            (name.str.ends_with('Manager') | (pl.col('salary') > 100000)).alias('is_manager')
+        )
+        .sort('upper_name', maintain_order=True)
+        .collect()
+    )
     
-    # Filter people with 'a' or 'e' in name
-    filtered = [p for p in people if 'a' in p.name or 'e' in p.name]
+    # Polars has no grouped currency format, so that stays a Python f-string
+    return [
+        PersonProjection(
+            id=person_id,
+            upper_name=upper_name,
+            name_length=name_length,
+            formatted_salary=f"${salary:,.2f}",
+            is_manager=is_manager
+        )
+        for person_id, upper_name, name_length, salary, is_manager in projections.iter_rows()
+    ]
+
+def run_nested_queries_polars(frame: 'pl.DataFrame') -> List[DepartmentAnalysis]:
+    """Nested queries as a Polars lazy query"""
+    
+    departments = (
+        frame.lazy()
+        .group_by('dept', maintain_order=True)
+        .agg(
+            pl.len().alias('employee_count'),
+            (pl.col('salary') > 75000).sum().alias('high_earners'),
+            pl.col('age').mean().alias('average_age')
+        )
+        .filter(pl.col('employee_count') > 50)
+        .sort('high_earners', descending=True, maintain_order=True)
+        .collect()
+    )
     
-    # Project to new structure
-    projections = []
-    for person in filtered:
-        try:
-            formatted_salary = locale.currency(person.salary, grouping=True)
-        except:
-            formatted_salary = f"${person.salary:,.2f}"
-            
-        projection = PersonProjection(
-            id=person.id,
-            upper_name=person.name.upper(),
-            name_length=len(person.name),
-            formatted_salary=formatted_salary,
-            is_manager=person.name.endswith('Manager') or person.salary > 100000
+    return [
+        DepartmentAnalysis(
+            department=DEPARTMENTS[dept_code],
+            employee_count=employee_count,
+            high_earners=high_earners,
+            average_age=average_age
         )
-        
-        if projection.name_length > 5:
-            projections.append(projection)
+        for dept_code, employee_count, high_earners, average_age in departments.iter_rows()
+    ]
+
+def run_projection_operations_polars(frame: 'pl.DataFrame') -> List[YoungProfessional]:
+    """Projection with filtering as a Polars lazy query"""
+    
+    tenure_days = pl.col('tenure_days')
+    top = (
+        frame.lazy()
+        .with_columns((today_day_number() - pl.col('hire_day')).alias('tenure_days'))
+        .filter((tenure_days < 5 * 365) & (pl.col('age') < 30) & (pl.col('salary') > 60000))
+        .sort(['tenure_days', 'id'], descending=[True, False])  # ids keep ties in input order
+        .head(1000)
+        .select('id', polars_names(), 'age', 'salary', 'tenure_days')
+        .collect()
+    )
+    
+    bracket_codes = np.searchsorted(SALARY_BRACKET_BOUNDS, top['salary'].to_numpy(), side='right')
     
-    # Sort by upper name
-    return sorted(projections, key=lambda x: x.upper_name)
+    return [
+        YoungProfessional(
+            id=person_id,
+            name=name,
+            age=age,
+            salary_bracket=SALARY_BRACKETS[bracket],
+            years_of_service=tenure / 365.25,
+            is_young_professional=True
+        )
+        for (person_id, name, age, _, tenure), bracket in zip(top.iter_rows(), bracket_codes.tolist())
+    ]
 
-def run_nested_queries(people: List[Person]) -> List[DepartmentAnalysis]:
-    """Nested queries equivalent"""
+def people_table(people: People) -> 'pa.Table':
+    """Wrap the People columns in an Arrow table for the arrow backend (zero-copy)"""
+    if pa is None:
+        raise ImportError("The arrow backend needs the pyarrow package")
+    
+    return pa.table({
+        'dept': people.dept_codes,
+        'age': people.ages,
+        'salary': people.salaries,
+        'hire_day': people.hire_day_offsets
+    })
+
+def run_complex_operations_arrow(table: 'pa.Table') -> List[DepartmentStats]:
+    """Complex operation chain with Arrow compute kernels"""
     
-    # Get unique departments
-    departments = list(set(p.department for p in people))
+    mask = pc.and_(pc.greater(table['age'], 25), pc.greater(table['salary'], 50000))
+    stats = (
+        table.filter(mask)
+        .group_by('dept')
+        .aggregate([('salary', 'count'), ('salary', 'mean'), ('salary', 'max'), ('age', 'min')])
+    )
+    stats = stats.filter(pc.greater(stats['salary_count'], 10)).sort_by([('salary_mean', 'descending')])
     
-    results = []
-    for dept in departments:
-        dept_people = [p for p in people if p.department == dept]
-        
-        if len(dept_people) > 50:
-            high_earners = sum(1 for p in dept_people if p.salary > 75000)
-            average_age = statistics.mean(p.age for p in dept_people)
-            
-            results.append(DepartmentAnalysis(
-                department=dept,
-                employee_count=len(dept_people),
-                high_earners=high_earners,
-                average_age=average_age
-            ))
+    return [
+        DepartmentStats(
+            department=DEPARTMENTS[row['dept']],
+            count=row['salary_count'],
+            average_salary=row['salary_mean'],
+            max_salary=row['salary_max'],
+            min_age=row['age_min']
+        )
+        for row in stats.to_pylist()
+    ]
+
+def run_groupby_operations_arrow(table: 'pa.Table') -> List[AgeGroupStats]:
+    """GroupBy operations with Arrow compute kernels"""
+    
+    groups = (
+        table.append_column('age_group', pc.multiply(pc.divide(table['age'], 10), 10))
+        .append_column('tenure', pc.subtract(today_day_number(), table['hire_day']))
+        .group_by(['dept', 'age_group'])
+        .aggregate([('salary', 'count'), ('salary', 'sum'), ('tenure', 'mean')])
+    )
+    groups = groups.filter(pc.greater(groups['salary_count'], 5))
+    
+    results = [
+        AgeGroupStats(
+            department=DEPARTMENTS[row['dept']],
+            age_group=row['age_group'],
+            count=row['salary_count'],
+            total_salary=row['salary_sum'],
+            average_tenure=row['tenure_mean']
+        )
+        for row in groups.to_pylist()
+    ]
     
-    # Sort by high earners descending
-    return sorted(results, key=lambda x: x.high_earners, reverse=True)
+    # Sort by department name, then age group
+    return sorted(results, key=lambda x: (x.department, x.age_group))
 
-def run_projection_operations(people: List[Person]) -> List[YoungProfessional]:
-    """Projection with filtering operations"""
+def run_nested_queries_arrow(table: 'pa.Table') -> List[DepartmentAnalysis]:
+    """Nested queries with Arrow compute kernels"""
+    
+    # Single-threaded grouping keeps departments in first-seen order for ties
+    departments = (
+        table.append_column('high_earner', pc.greater(table['salary'], 75000))
+        .group_by('dept', use_threads=False)
+        .aggregate([('salary', 'count'), ('high_earner', 'sum'), ('age', 'mean')])
+    )
+    departments = (
+        departments.filter(pc.greater(departments['salary_count'], 50))
+        .sort_by([('high_earner_sum', 'descending')])
+    )
     
-    five_years_ago = datetime.now() - timedelta(days=5*365)
-    now = datetime.now()
-    
-    # Filter recent hires
-    recent_hires = [p for p in people if p.hire_date > five_years_ago]
-    
-    def get_salary_bracket(salary: float) -> str:
-        if salary < 40000:
-            return 'Entry Level'
-        elif salary < 60000:
-            return 'Junior'
-        elif salary < 80000:
-            return 'Mid Level'
-        elif salary < 100000:
-            return 'Senior'
-        else:
-            return 'Executive'
-    
-    # Project and filter young professionals
-    young_pros = []
-    for person in recent_hires:
-        years_of_service = (now - person.hire_date).days / 365.25
-        is_young_prof = person.age < 30 and person.salary > 60000
-        
-        if is_young_prof:
-            young_pros.append(YoungProfessional(
-                id=person.id,
-                name=person.name,
-                age=person.age,
-                salary_bracket=get_salary_bracket(person.salary),
-                years_of_service=years_of_service,
-                is_young_professional=is_young_prof
-            ))
-    
-    # Sort by years of service descending and take top 1000
-    sorted_pros = sorted(young_pros, key=lambda x: x.years_of_service, reverse=True)
-    return sorted_pros[:1000]
+    return [
+        DepartmentAnalysis(
+            department=DEPARTMENTS[row['dept']],
+            employee_count=row['salary_count'],
+            high_earners=row['high_earner_sum'],
+            average_age=row['age_mean']
+        )
+        for row in departments.to_pylist()
+    ]
 
-def measure_performance(operation_name: str, operation_func, *args) -> float:
-    """Measure performance of an operation with multiple iterations"""
+agg_kernels = None  # Cython module from agg_kernels.pyx, built on first use
+
+def load_cython_kernels() -> None:
+    """Build (first time only) and import the Cython kernels for the cython backend"""
+    global agg_kernels
+    if agg_kernels is None:
+        try:
+            import pyximport
+        except ImportError:
+            raise ImportError("The cython backend needs the Cython package and a C compiler") from None
+
+        # Compiled once into the pyximport cache, then reused across runs
+        pyximport.install(language_level=3)
+        import agg_kernels as module
+        agg_kernels = module
+
+def run_complex_operations_cython(people: People) -> List[DepartmentStats]:
+    """Complex operation chain as one Cython pass"""
+    return department_stats(
+        np.arange(len(DEPARTMENTS)),
+        *agg_kernels.agg_by_dept(people.dept_codes, people.ages, people.salaries)
+    )
+
+def run_groupby_operations_cython(people: People) -> List[AgeGroupStats]:
+    """GroupBy operations as one Cython pass"""
+    return age_group_stats(*agg_kernels.agg_age_dept(
+        people.dept_codes, people.ages, people.salaries, people.hire_day_offsets, today_day_number()
+    ))
+
+def run_nested_queries_cython(people: People) -> List[DepartmentAnalysis]:
+    """Nested queries as one Cython pass"""
+    return department_analysis(*agg_kernels.agg_dept_analysis(people.dept_codes, people.ages, people.salaries))
+
+def run_projection_operations_cython(people: People) -> List[YoungProfessional]:
+    """Projection with the filter mask built by a Cython kernel"""
+    today = today_day_number()
+    mask = agg_kernels.young_professional_mask(people.ages, people.salaries, people.hire_day_offsets, today)
+    return top_young_professionals(people, np.flatnonzero(mask), today)
+
+def time_operation(operation_func, *args) -> List[float]:
+    """Time an operation over multiple iterations, in milliseconds"""
     
     iterations = 5
     times = []
@@ -284,37 +764,159 @@ def measure_performance(operation_name: str, operation_func, *args) -> float:
         duration = timer.stop()
         times.append(duration)
     
-    avg_time = statistics.mean(times)
+    return times
+
+def print_timings(operation_name: str, times: List[float]) -> float:
+    """Print the average, min and max of an operation's timings"""
+    
+    avg_time = sum(times) / len(times)
     min_time = min(times)
     max_time = max(times)
     
     print(f"{operation_name:<25}: Avg: {avg_time:.1f}ms, Min: {min_time:.0f}ms, Max: {max_time:.0f}ms")
     return avg_time
 
+def measure_performance(operation_name: str, operation_func, *args) -> float:
+    """Measure performance of an operation with multiple iterations"""
+    return print_timings(operation_name, time_operation(operation_func, *args))
+
+def share_people(people: People) -> Tuple[List[shared_memory.SharedMemory], Dict]:
+    """Copy the People columns into shared memory; returns the blocks and their layout"""
+    blocks = []
+    layout = {}
+    
+    for field in fields(People):
+        column = getattr(people, field.name)
+        block = shared_memory.SharedMemory(create=True, size=max(column.nbytes, 1))
+        np.ndarray(column.shape, column.dtype, buffer=block.buf)[:] = column
+        blocks.append(block)
+        layout[field.name] = (block.name, column.shape, column.dtype.str)
+    
+    return blocks, layout
+
+def time_shared_operation(layout: Dict, backend: str, operation_index: int) -> List[float]:
+    """Worker process entry: time one benchmark over People views of the shared columns"""
+    blocks = {name: shared_memory.SharedMemory(name=block_name) for name, (block_name, _, _) in layout.items()}
+    people = People(**{
+        name: np.ndarray(shape, dtype, buffer=blocks[name].buf)
+        for name, (_, shape, dtype) in layout.items()
+    })
+    
+    if backend in BACKEND_SETUP:
+        BACKEND_SETUP[backend]()
+    prepare, operations = BACKENDS[backend]
+    times = time_operation(operations[operation_index][1], prepare(people))
+    
+    # The views must go before the blocks can be closed
+    del people
+    for block in blocks.values():
+        block.close()
+    return times
+
+def measure_concurrently(people: People, backend: str) -> None:
+    """Run each benchmark in its own process at the same time, sharing the dataset"""
+    _, operations = BACKENDS[backend]
+    blocks, layout = share_people(people)
+    
+    try:
+        # Spawn rather than fork: forking after Polars/Numba started their
+        # thread pools can deadlock the children
+        spawn = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=len(operations), mp_context=spawn) as pool:
+            futures = [
+                pool.submit(time_shared_operation, layout, backend, index)
+                for index in range(len(operations))
+            ]
+            for (operation_name, _), future in zip(operations, futures):
+                print_timings(operation_name, future.result())
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+# BENCH_BACKEND name -> (People to backend data conversion, benchmark operations)
+BACKENDS = {
+    'numpy': (lambda people: people, [
+        ("Complex Operations", run_complex_operations),
+        ("GroupBy with Aggregation", run_groupby_operations),
+        ("String Operations", run_string_operations),
+        ("Nested Queries", run_nested_queries),
+        ("Projection with Filter", run_projection_operations),
+    ]),
+    'polars': (people_frame, [
+        ("Complex Operations", run_complex_operations_polars),
+        ("GroupBy with Aggregation", run_groupby_operations_polars),
+        ("String Operations", run_string_operations_polars),
+        ("Nested Queries", run_nested_queries_polars),
+        ("Projection with Filter", run_projection_operations_polars),
+    ]),
+    'arrow': (people_table, [
+        ("Complex Operations", run_complex_operations_arrow),
+        ("GroupBy with Aggregation", run_groupby_operations_arrow),
+        ("Nested Queries", run_nested_queries_arrow),
+    ]),
+    'cython': (lambda people: people, [
+        ("Complex Operations", run_complex_operations_cython),
+        ("GroupBy with Aggregation", run_groupby_operations_cython),
+        ("String Operations", run_string_operations),
+        ("Nested Queries", run_nested_queries_cython),
+        ("Projection with Filter", run_projection_operations_cython),
+    ]),
+}
+
+# BENCH_BACKEND name -> one-time setup, run in the parent before any worker
+# process starts so that concurrent workers only load what it built
+BACKEND_SETUP = {
+    'cython': load_cython_kernels,
+}
+
+# Without Numba scan_all is a plain Python loop over every row, and its timing
+# would say nothing about the fused approach
+if HAVE_NUMBA:
+    BACKENDS['numpy'][1].append(("Fused Single Scan", run_fused_operations))
+
 def main():
     """Main performance testing function"""
     
+    backend = os.environ.get('BENCH_BACKEND', 'numpy')
+    if backend not in BACKENDS:
+        sys.exit(f"Unknown BENCH_BACKEND '{backend}', expected one of: {', '.join(BACKENDS)}")
+    prepare, operations = BACKENDS[backend]
+    
     print(f"Running on: Python {sys.version}")
     print(f"CPU Count: {multiprocessing.cpu_count()}")
+    print(f"Backend: {backend}")
     print()
     
+    if backend in BACKEND_SETUP:
+        BACKEND_SETUP[backend]()
+    
     # Generate test data
     print("Generating test data...")
     people = generate_test_data(1_000_000)
     
+    # BENCH_CONCURRENT=1 runs the tests in parallel processes; the timings then
+    # include contention between tests and are not comparable to sequential runs.
+    # Each worker converts the shared columns and warms up on its own
+    if os.environ.get('BENCH_CONCURRENT') == '1':
+        print("\nPerformance Test Results (concurrent, one process per test):")
+        print("============================================================")
+        measure_concurrently(people, backend)
+        return
+    
+    data = prepare(people)
+    gc.freeze()  # Move the dataset out of the way of later collections
+    
     # Warm up JIT/interpreter
     print("Warming up...")
-    run_complex_operations(people[:1000])
+    operations[0][1](prepare(people[:1000]))
     
     print("\nPerformance Test Results:")
     print("========================")
     
     # Run performance tests
-    measure_performance("Complex Operations", run_complex_operations, people)
-    measure_performance("GroupBy with Aggregation", run_groupby_operations, people)
-    measure_performance("String Operations", run_string_operations, people)
-    measure_performance("Nested Queries", run_nested_queries, people)
-    measure_performance("Projection with Filter", run_projection_operations, people)
+    for operation_name, operation_func in operations:
+        measure_performance(operation_name, operation_func, data)
 
 if __name__ == "__main__":
     main()